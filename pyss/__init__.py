@@ -1,3 +1,10 @@
-from pyss.semanticscholar import Author, ExceedMaxRetryCountException, NoPaperFoundException, Paper, SemanticScholar
+from pyss.semanticscholar import (
+    Author,
+    ExceedMaxRetryCountException,
+    NoPaperFoundException,
+    Paper,
+    RateLimiter,
+    SemanticScholar,
+)
 
-__all__ = ["SemanticScholar", "Author", "Paper", "ExceedMaxRetryCountException", "NoPaperFoundException"]
+__all__ = ["SemanticScholar", "Author", "Paper", "RateLimiter", "ExceedMaxRetryCountException", "NoPaperFoundException"]
@@ -1,22 +1,284 @@
 from __future__ import annotations
 
-import json
-import re
-import socket
+import asyncio
+import contextlib
+import functools
+import hashlib
+import random
+import sqlite3
 import string
+import sys
+import threading
 import time
 import urllib.parse
-import urllib.request
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from logging import Logger
 from pathlib import Path
-from typing import Any, Optional, Union
-from urllib.error import HTTPError, URLError
+from typing import Any, Callable, Generator, Iterator, Optional, Union
+from urllib.error import HTTPError
 
+import aiohttp
+import orjson
+import urllib3
 from dateutil.parser import parse as parse_date
+from rapidfuzz import process
+from rapidfuzz.distance import Indel
 from sumeval.metrics.rouge import RougeCalculator
-from tqdm import tqdm
+
+_RETRY_STATUSES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+_BACKOFF_CAP: float = 30.0
+
+
+def _full_jitter(base: float, retry: int) -> float:
+    # spreads concurrent clients over the whole backoff window instead of retrying in lockstep
+    return random.uniform(0, min(_BACKOFF_CAP, base * 2**retry))
+
+
+class _FullJitterRetry(urllib3.Retry):
+    def __init__(
+        self, *args: Any, logger: Optional[Logger] = None, limiter: Optional[RateLimiter] = None, **kwargs: Any
+    ):
+        super().__init__(*args, **kwargs)
+        self.logger = logger
+        self.limiter = limiter
+
+    def new(self, **kwargs: Any) -> _FullJitterRetry:
+        return super().new(logger=self.logger, limiter=self.limiter, **kwargs)
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        # one line per retry, while urllib3 does the waiting
+        if self.logger is not None:
+            cause = (
+                "API Limit Exceeded"
+                if response is not None and response.status == 429
+                else str(error or response.status)
+            )
+            self.logger.warning(f"WARNING: {cause} -> Retry: {len(retry.history)}")
+        return retry
+
+    def get_backoff_time(self) -> float:
+        return random.uniform(0, super().get_backoff_time())
+
+    def sleep(self, response: Optional[urllib3.BaseHTTPResponse] = None):
+        super().sleep(response)
+        # each retried attempt is a request of its own, so it waits for a slot just like the first one
+        if self.limiter is not None:
+            self.limiter.acquire()
+
+
+class RateLimiter(object):
+    """
+    Spaces requests evenly at a fixed rate. One instance may be shared by several clients so that they draw on
+    the same budget; subclasses can override `_reserve` to coordinate across processes instead of threads.
+
+    Args:
+        rate (float): The number of requests allowed per second.
+    """
+
+    def __init__(self, rate: float):
+        self.interval: float = 1.0 / rate
+        self.__next: float = 0.0
+        self.__lock: threading.Lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        # hands out evenly spaced start times shared by threads and coroutines; returns how long to wait for ours
+        with self.__lock:
+            now = time.monotonic()
+            slot = max(now, self.__next)
+            self.__next = slot + self.interval
+        return slot - now
+
+    def acquire(self):
+        delay = self._reserve()
+        if 0 < delay:
+            time.sleep(delay)
+
+    async def aacquire(self):
+        delay = self._reserve()
+        if 0 < delay:
+            await asyncio.sleep(delay)
+
+
+# shared by every client so that keep-alive connections to the API host survive across instances
+_HTTP: urllib3.PoolManager = urllib3.PoolManager(num_pools=4, maxsize=16)
+_PAPER_DETAIL_PARAMS = "fields=" + ",".join(
+    (
+        "paperId",
+        "url",
+        "title",
+        "abstract",
+        "venue",
+        "year",
+        "referenceCount",
+        "citationCount",
+        "influentialCitationCount",
+        "isOpenAccess",
+        "openAccessPdf",
+        "fieldsOfStudy",
+        "externalIds",
+        "publicationVenue",
+        "publicationTypes",
+        "publicationDate",
+        "authors.authorId",
+        "authors.name",
+        "authors.url",
+        "authors.affiliations",
+        "authors.hIndex",
+        "authors.paperCount",
+        "authors.citationCount",
+        "citations.paperId",
+        "citations.title",
+        "citations.year",
+        "citations.url",
+        "citations.abstract",
+        "citations.authors",
+        "citations.venue",
+        "citations.journal",
+        "citations.externalIds",
+        "citations.fieldsOfStudy",
+        "citations.publicationDate",
+        "citations.publicationVenue",
+        "citations.publicationTypes",
+        "citations.referenceCount",
+        "citations.citationCount",
+        "citations.influentialCitationCount",
+        "references.paperId",
+        "references.title",
+        "references.year",
+        "references.url",
+        "references.abstract",
+        "references.authors",
+        "references.venue",
+        "references.journal",
+        "references.externalIds",
+        "references.fieldsOfStudy",
+        "references.publicationDate",
+        "references.publicationVenue",
+        "references.publicationTypes",
+        "references.referenceCount",
+        "references.citationCount",
+        "references.influentialCitationCount",
+    )
+)
+_TITLE_SEARCH_PARAMS = urllib.parse.urlencode({"fields": "title", "offset": 0})
+# the API ranks by relevance, so a short first page usually holds the match
+_TITLE_SEARCH_LIMITS: tuple[int, ...] = (10, 100)
+# how long title searches and titles that resolved to no paper are remembered, as the index keeps growing
+_TITLE_SEARCH_TTL: float = 60 * 60
+_BATCH_SIZE: int = 500
+_REFERENCES_PAGE_SIZE: int = 1000
+_REFERENCES_PARAMS = "fields=" + ",".join(
+    (
+        "paperId",
+        "url",
+        "title",
+        "abstract",
+        "venue",
+        "year",
+        "referenceCount",
+        "citationCount",
+        "influentialCitationCount",
+        "isOpenAccess",
+        "openAccessPdf",
+        "fieldsOfStudy",
+        "externalIds",
+        "publicationVenue",
+        "publicationTypes",
+        "publicationDate",
+        "authors",
+    )
+)
+_AUTHOR_PARAMS = "fields=" + ",".join(
+    ("authorId", "url", "name", "affiliations", "paperCount", "citationCount", "hIndex")
+)
+# the papers are needed to pick the author of a given paper among namesakes
+_AUTHOR_SEARCH_PARAMS = _AUTHOR_PARAMS + ",papers.paperId"
+_PUNCT_TABLE = str.maketrans({c: " " for c in string.punctuation})
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_title(title: str) -> str:
+    return " ".join(title.lower().translate(_PUNCT_TABLE).split())
+
+
+# (attribute name, API key, expected type, default factory)
+_FieldSpec = tuple[str, str, type, Callable[[], Any]]
+_AUTHOR_FIELDS: tuple[_FieldSpec, ...] = (
+    ("author_id", "authorId", str, str),
+    ("author_name", "name", str, str),
+    ("url", "url", str, str),
+    ("affiliations", "affiliations", list, list),
+    ("paper_count", "paperCount", int, int),
+    ("citation_count", "citationCount", int, int),
+    ("hindex", "hIndex", int, int),
+)
+_PAPER_FIELDS: tuple[_FieldSpec, ...] = (
+    ("paper_id", "paperId", str, str),
+    ("title", "title", str, str),
+    ("abstract", "abstract", str, str),
+    ("venue", "venue", str, str),
+    ("url", "url", str, str),
+    ("publication_date", "publicationDate", datetime, lambda: datetime(1900, 1, 1)),
+    ("publication_venue", "publicationVenue", dict, dict),
+    ("publication_types", "publicationTypes", list, list),
+    ("reference_count", "referenceCount", int, int),
+    ("citation_count", "citationCount", int, int),
+    ("influential_citation_count", "influentialCitationCount", int, int),
+    ("is_open_access", "isOpenAccess", bool, bool),
+    ("fields_of_study", "fieldsOfStudy", list, list),
+    ("external_ids", "externalIds", dict, dict),
+)
+# values repeated across many authors/citations/references share a single string object
+_INTERNED_FIELDS: frozenset[str] = frozenset({"author_id", "paper_id", "venue", "fields_of_study"})
+
+
+def _parse_date(value: str) -> datetime:
+    # the API sends strict YYYY-MM-DD, which the C parser handles; dateutil only covers anything looser
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return parse_date(value)
+
+
+def _extract(item: dict, fields: tuple[_FieldSpec, ...]) -> dict[str, Any]:
+    res = {}
+    for name, key, kind, default in fields:
+        value = item.get(key)
+        if kind is datetime:
+            value = _parse_date(value) if value and isinstance(value, str) else default()
+        elif not isinstance(value, kind):
+            value = default()
+        elif name in _INTERNED_FIELDS:
+            value = sys.intern(value) if kind is str else [sys.intern(v) for v in value if isinstance(v, str)]
+        res[name] = value
+    return res
+
+
+def _author_from(item: dict) -> Author:
+    return Author(**_extract(item, _AUTHOR_FIELDS))
+
+
+def _paper_from(item: dict, citations: Optional[list[Paper]] = None, references: Optional[list[Paper]] = None) -> Paper:
+    return Paper(
+        **_extract(item, _PAPER_FIELDS),
+        open_access_pdf=(item.get("openAccessPdf") or {}).get("url", ""),
+        authors=[_author_from(author) for author in item.get("authors") or []],
+        citations=citations or [],
+        references=references or [],
+    )
+
+
+def _detailed_paper_from(content: dict) -> Paper:
+    # citations and references are shallow: their own citations/references are never requested
+    return _paper_from(
+        content,
+        citations=[_paper_from(item) for item in content.get("citations") or []],
+        references=[_paper_from(item) for item in content.get("references") or []],
+    )
 
 
 class NoAuthorFoundException(Exception):
@@ -55,23 +317,23 @@ class ExceedMaxRetryCountException(Exception):
 @dataclass
 class Api(object):
     search_by_title: str = "https://api.semanticscholar.org/graph/v1/paper/search?{QUERY}"
+    match_by_title: str = "https://api.semanticscholar.org/graph/v1/paper/search/match?{QUERY}"
     search_by_id: str = "https://api.semanticscholar.org/graph/v1/paper/{PAPER_ID}?{PARAMS}"
     search_by_author_id: str = "https://api.semanticscholar.org/graph/v1/author/{AUTHOR_ID}?{PARAMS}"
     search_by_author_name: str = "https://api.semanticscholar.org/graph/v1/author/search?query={QUERY}&{PARAMS}"
     search_references: str = "https://api.semanticscholar.org/graph/v1/paper/{PAPER_ID}/references?{PARAMS}"
+    search_by_ids: str = "https://api.semanticscholar.org/graph/v1/paper/batch?{PARAMS}"
     api_key: str = ""
 
-    def urlopen(self, url: str, timeout: int = 30, **kwargs) -> urllib.request._UrlopenRet:
-        url = url.format(**kwargs)
+    @property
+    def headers(self) -> dict[str, str]:
+        headers = {"User-Agent": "pyss/0.0.1"}
         if self.api_key:
-            opener = urllib.request.build_opener()
-            opener.addheaders = [("X-API-Key", self.api_key)]
-            return opener.open(url, timeout=timeout)
-        else:
-            return urllib.request.urlopen(url, timeout=timeout)
+            headers["X-API-Key"] = self.api_key
+        return headers
 
 
-@dataclass()
+@dataclass(slots=True, frozen=True, eq=False)
 class Author(object):
     author_id: str
     author_name: str
@@ -101,7 +363,7 @@ class Author(object):
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False)
 class Paper(object):
     paper_id: str
     title: str
@@ -130,41 +392,54 @@ class Paper(object):
         return self.paper_id == other.paper_id
 
     def __hash__(self) -> int:
-        return hash(self.ss_id)
+        return hash(self.paper_id)
 
     def __lt__(self, other: Paper) -> bool:
         return self.paper_id < other.paper_id
 
     def exact_match(self, other: Paper):
+        # cheap scalar comparisons first so that the common "not equal" case short-circuits early
         return (
-            self.title == other.title
-            and self.abstract == other.abstract
-            and self.venue == other.venue
-            and self.year == other.year
-            and self.url == other.url
-            and self.publication_date == other.publication_date
+            self.publication_date == other.publication_date
             and self.reference_count == other.reference_count
             and self.citation_count == other.citation_count
             and self.influential_citation_count == other.influential_citation_count
             and self.is_open_access == other.is_open_access
+            and len(self.authors) == len(other.authors)
+            and len(self.citations) == len(other.citations)
+            and len(self.references) == len(other.references)
+            and self.title == other.title
+            and self.venue == other.venue
+            and self.url == other.url
+            and self.abstract == other.abstract
             and self.fields_of_study == other.fields_of_study
-            and all([a.exact_match(b) for a, b in zip(sorted(self.authors), sorted(other.authors))])
-            and all([c.exact_match(d) for c, d in zip(sorted(self.citations), sorted(other.citations))])
-            and all([r.exact_match(s) for r, s in zip(sorted(self.references), sorted(other.references))])
+            and all(a.exact_match(b) for a, b in zip(sorted(self.authors), sorted(other.authors)))
+            and all(c.exact_match(d) for c, d in zip(sorted(self.citations), sorted(other.citations)))
+            and all(r.exact_match(s) for r, s in zip(sorted(self.references), sorted(other.references)))
         )
 
 
 class SemanticScholar(object):
     """
     A class for interacting with the Semantic Scholar API to retrieve paper and author information.
+    Requests are paced at the API rate limit, 1 request per second without an API key and 10 with one.
 
     Args:
         threshold (float, optional): The threshold value for matching paper titles (default: 0.95).
         silent (bool, optional): Whether to suppress console output (default: True).
         max_retry_count (int, optional): The maximum number of retries for API requests (default: 5).
+        cache_ttl (float, optional): The lifetime of cached API responses in seconds (default: 30 days).
+        bypass_cache (bool, optional): Whether to skip the on-disk response cache entirely (default: False).
+        prefilter_threshold (float, optional): The minimum token overlap, relative to the shorter title, a candidate
+            title needs before it is scored with ROUGE-L (default: threshold - 0.2).
+        fast_match (bool, optional): Whether to compute ROUGE-L with the C++ LCS of rapidfuzz instead of the pure
+            Python implementation of sumeval (default: True).
+        rate_limiter (RateLimiter, optional): The limiter that paces requests, e.g. one shared by several clients
+            (default: a new limiter at the API rate for the given key).
     """
 
-    CACHE_PATH: Path = Path("__cache__/papers.pickle")
+    CACHE_PATH: Path = Path("__cache__/responses.sqlite")
+    _rouge_cache: Optional[RougeCalculator] = None
 
     def __init__(
         self,
@@ -173,16 +448,69 @@ class SemanticScholar(object):
         silent: bool = False,
         max_retry_count: int = 5,
         logger: Optional[Logger] = None,
+        cache_ttl: float = 60 * 60 * 24 * 30,
+        bypass_cache: bool = False,
+        prefilter_threshold: Optional[float] = None,
+        fast_match: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
     ):
         self.__api: Api = Api(api_key=api_key)
-        self.__rouge: RougeCalculator = RougeCalculator(
-            stopwords=True, stemming=False, word_limit=-1, length_limit=-1, lang="en"
+        self.__fast_match: bool = fast_match
+        self.__rouge_l: Callable[[str, str], float] = functools.lru_cache(maxsize=4096)(
+            self.__fast_rouge_l if fast_match else self.__sumeval_rouge_l
         )
         self.__threshold: float = threshold
+        self.__prefilter_threshold: float = threshold - 0.2 if prefilter_threshold is None else prefilter_threshold
         self.__silent: bool = silent
         self.__max_retry_count: int = max_retry_count
         self.__logger = logger
         self.__wait_time: int = 30 if api_key == "" else 1
+        # requests per second allowed by the API for anonymous and keyed clients
+        self.__limiter: RateLimiter = rate_limiter or RateLimiter(1.0 if api_key == "" else 10.0)
+        self.__retries: urllib3.Retry = _FullJitterRetry(
+            total=max_retry_count,
+            backoff_factor=3.0,
+            backoff_max=_BACKOFF_CAP,
+            status_forcelist=_RETRY_STATUSES,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+            # the only POST is the read-only batch lookup, which is safe to repeat
+            allowed_methods=urllib3.Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+            logger=None if silent else logger,
+            limiter=self.__limiter,
+        )
+        # advertises br (and zstd) only when the matching decoder is installed
+        self.__headers: dict[str, str] = {**self.__api.headers, **urllib3.util.make_headers(accept_encoding=True)}
+        self.__cache_ttl: float = cache_ttl
+        self.__title_search_ttl: float = min(cache_ttl, _TITLE_SEARCH_TTL)
+        # a keyed client gets entries of its own; the key only seeds the hash, so it is never written to the cache
+        self.__cache_namespace: bytes = hashlib.blake2b(api_key.encode("utf-8")).digest() if api_key else b""
+        self.__cache: Optional[sqlite3.Connection] = None
+        self.__cache_lock: threading.Lock = threading.Lock()
+        self.__session: Optional[aiohttp.ClientSession] = None
+        self.__session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.__prefetch_pool: Optional[ThreadPoolExecutor] = None
+        if not bypass_cache:
+            self.CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            self.__cache = sqlite3.connect(self.CACHE_PATH, check_same_thread=False)
+            self.__cache.execute("PRAGMA journal_mode=WAL")
+            self.__cache.execute("PRAGMA synchronous=NORMAL")
+            self.__cache.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, expire REAL, body BLOB, etag TEXT)"
+            )
+            # caches written before ETags were kept lack the column
+            if "etag" not in {row[1] for row in self.__cache.execute("PRAGMA table_info(responses)")}:
+                self.__cache.execute("ALTER TABLE responses ADD COLUMN etag TEXT")
+
+    @classmethod
+    def _rouge(cls) -> RougeCalculator:
+        # loading the stopword list dominates construction, so it is deferred to the first title match and shared
+        # by every instance
+        if cls._rouge_cache is None:
+            cls._rouge_cache = RougeCalculator(
+                stopwords=True, stemming=False, word_limit=-1, length_limit=-1, lang="en"
+            )
+        return cls._rouge_cache
 
     @property
     def threshold(self) -> float:
@@ -192,63 +520,203 @@ class SemanticScholar(object):
     def max_retry_count(self) -> int:
         return self.__max_retry_count
 
-    def __clean(self, dic: dict, key: str, default: Any) -> Any:
-        res = default
-        if key in dic:
-            if isinstance(default, list) and isinstance(dic[key], list):
-                res = dic[key]
-            elif isinstance(default, dict) and isinstance(dic[key], dict):
-                res = dic[key]
-            elif isinstance(default, str) and isinstance(dic[key], str):
-                res = dic[key]
-            elif dic[key] and isinstance(default, datetime):
-                res = parse_date(dic[key])
-            elif isinstance(default, int) and isinstance(dic[key], int):
-                res = dic[key]
-            elif isinstance(default, float) and isinstance(dic[key], float):
-                res = dic[key]
-
-        return res
-
-    def __retry_and_wait(
-        self, msg: str, ex: Union[HTTPError, URLError, socket.timeout, Exception], retry: int, sleep: float = 3.0
-    ) -> int:
-        retry += 1
-        if self.__max_retry_count < retry:
-            raise ex
-
-        if not self.__silent and self.__logger is not None:
-            self.__logger.warning(msg)
-
-        if isinstance(ex, HTTPError) and ex.errno == -3:
-            it = (
-                tqdm(
-                    range(self.__wait_time, 0, -1),
-                    desc=f"Error with code -3: Waiting for {self.__wait_time} sec",
-                    leave=False,
-                )
-                if not self.__silent
-                else range(self.__wait_time, 0, -1)
+    def __enter__(self) -> SemanticScholar:
+        return self
+
+    def __exit__(self, *exc_info: Any):
+        self.close()
+
+    async def __aenter__(self) -> SemanticScholar:
+        return self
+
+    async def __aexit__(self, *exc_info: Any):
+        await self.aclose()
+        self.close()
+
+    def close(self):
+        """
+        Waits for pending prefetches and closes the response cache. Use `aclose` to close the asynchronous client
+        as well. The instance keeps working afterwards, without the cache.
+        """
+        if self.__prefetch_pool is not None:
+            # queued prefetches still run, so that futures the caller holds resolve instead of being cancelled
+            self.__prefetch_pool.shutdown(wait=True)
+            self.__prefetch_pool = None
+        with self.__cache_lock:
+            if self.__cache is not None:
+                self.__cache.close()
+                self.__cache = None
+
+    def __cache_key(self, url: str) -> str:
+        return hashlib.blake2b(url.encode("utf-8"), key=self.__cache_namespace).hexdigest()
+
+    def __cache_get(self, url: str) -> Optional[bytes]:
+        if self.__cache is None:
+            return None
+        with self.__cache_lock:
+            row = self.__cache.execute(
+                "SELECT body FROM responses WHERE key = ? AND ? < expire", (self.__cache_key(url), time.time())
+            ).fetchone()
+        return None if row is None else zlib.decompress(row[0])
+
+    def __cache_get_validator(self, url: str) -> tuple[Optional[bytes], str]:
+        # an expired entry is still worth revalidating when the API gave it an ETag
+        if self.__cache is None:
+            return None, ""
+        with self.__cache_lock:
+            row = self.__cache.execute(
+                "SELECT body, etag FROM responses WHERE key = ? AND etag != ''", (self.__cache_key(url),)
+            ).fetchone()
+        return (None, "") if row is None else (zlib.decompress(row[0]), row[1])
+
+    def __cache_set(self, url: str, body: bytes, etag: str = "", ttl: Optional[float] = None):
+        if self.__cache is None:
+            return
+        expire = time.time() + (self.__cache_ttl if ttl is None else ttl)
+        with self.__cache_lock, self.__cache:
+            self.__cache.execute(
+                "INSERT OR REPLACE INTO responses (key, expire, body, etag) VALUES (?, ?, ?, ?)",
+                (self.__cache_key(url), expire, zlib.compress(body, 1), etag),
             )
-            for _ in it:
-                time.sleep(1.0)
-        elif isinstance(ex, HTTPError) and ex.code == 429:
-            it = (
-                tqdm(
-                    range(self.__wait_time, 0, -1),
-                    desc=f"API Limit Exceeded: Waiting for {self.__wait_time} sec",
-                    leave=False,
-                )
-                if not self.__silent
-                else range(self.__wait_time, 0, -1)
+
+    def __cache_set_paper_id(self, query: str, paper_id: str):
+        # a miss may be a paper not indexed yet or a transient failure of the fallback, so it is retried sooner
+        ttl = None if paper_id else self.__title_search_ttl
+        self.__cache_set(self.__title_cache_key(query), paper_id.encode("utf-8"), ttl=ttl)
+
+    def _get_json(self, url: str, api_timeout: float = 5.0, sleep: float = 0.0, ttl: Optional[float] = None) -> Any:
+        """
+        Fetches a JSON document from the Semantic Scholar API, consulting the response cache first.
+
+        Args:
+            url (str): The URL to fetch.
+            api_timeout (float, optional): The timeout value for the API request in seconds. Defaults to 5.0.
+            sleep (float, optional): An extra wait after each request, on top of the rate limiter. Defaults to 0.0.
+            ttl (float, optional): The lifetime of the cached response in seconds. Defaults to the client's cache_ttl.
+
+        Returns:
+            Any: The decoded JSON content.
+
+        Raises:
+            ExceedMaxRetryCountException: If the maximum retry count is exceeded.
+        """
+        return orjson.loads(self._get_body(url, api_timeout, sleep, ttl))
+
+    def _get_body(self, url: str, api_timeout: float = 5.0, sleep: float = 0.0, ttl: Optional[float] = None) -> bytes:
+        """
+        Fetches the raw JSON body of a Semantic Scholar API response, consulting the response cache first.
+
+        Args:
+            url (str): The URL to fetch.
+            api_timeout (float, optional): The timeout value for the API request in seconds. Defaults to 5.0.
+            sleep (float, optional): An extra wait after each request, on top of the rate limiter. Defaults to 0.0.
+            ttl (float, optional): The lifetime of the cached response in seconds. Defaults to the client's cache_ttl.
+
+        Returns:
+            bytes: The undecoded response body.
+
+        Raises:
+            ExceedMaxRetryCountException: If the maximum retry count is exceeded.
+        """
+        body = self.__cache_get(url)
+        if body is not None:
+            return body
+
+        stale_body, etag = self.__cache_get_validator(url)
+        response = self.__request("GET", url, api_timeout, headers={"If-None-Match": etag} if etag else None)
+        if response.status == 304 and stale_body is not None:
+            # unchanged upstream: no body was transferred, so only the expiry is renewed
+            self.__cache_set(url, stale_body, etag, ttl)
+            return stale_body
+
+        body = response.data
+        time.sleep(sleep)
+        self.__cache_set(url, body, response.headers.get("ETag", ""), ttl)
+        return body
+
+    def _post_json(self, url: str, payload: Any, api_timeout: float = 5.0, sleep: float = 0.0) -> Any:
+        """
+        Posts a JSON document to the Semantic Scholar API and decodes the JSON response. Responses are not cached.
+
+        Args:
+            url (str): The URL to post to.
+            payload (Any): The JSON-serializable request body.
+            api_timeout (float, optional): The timeout value for the API request in seconds. Defaults to 5.0.
+            sleep (float, optional): An extra wait after each request, on top of the rate limiter. Defaults to 0.0.
+
+        Returns:
+            Any: The decoded JSON content.
+
+        Raises:
+            ExceedMaxRetryCountException: If the maximum retry count is exceeded.
+        """
+        response = self.__request(
+            "POST", url, api_timeout, body=orjson.dumps(payload), headers={"Content-Type": "application/json"}
+        )
+        content = orjson.loads(response.data)
+        time.sleep(sleep)
+        return content
+
+    def __request(
+        self, method: str, url: str, api_timeout: float, body: bytes = b"", headers: Optional[dict[str, str]] = None
+    ) -> urllib3.BaseHTTPResponse:
+        self.__limiter.acquire()
+        try:
+            response = _HTTP.request(
+                method,
+                url,
+                body=body or None,
+                headers={**self.__headers, **headers} if headers else self.__headers,
+                retries=self.__retries,
+                timeout=urllib3.Timeout(total=api_timeout),
             )
-            for _ in it:
-                time.sleep(1.0)
-        elif isinstance(ex, HTTPError):
-            raise ex
-        else:
-            time.sleep(sleep)
-        return retry
+        except urllib3.exceptions.MaxRetryError as ex:
+            raise ExceedMaxRetryCountException(f"Exceeded Max Retry Count @ {url}") from ex
+        if response.status in _RETRY_STATUSES:
+            raise ExceedMaxRetryCountException(f"Exceeded Max Retry Count @ {url}")
+        if 400 <= response.status:
+            raise HTTPError(url, response.status, response.reason, response.headers, None)
+        return response
+
+    def __title_cache_key(self, query: str) -> str:
+        # titles differing only in case, punctuation or spacing resolve to the same entry; the match settings are
+        # part of the key since they decide the result
+        return f"paper_id_from_title|{query}|{self.threshold}|{self.__prefilter_threshold}|{self.__fast_match}"
+
+    def __title_match_url(self, title: str) -> str:
+        return self.__api.match_by_title.format(QUERY=urllib.parse.urlencode({"query": title, "fields": "title"}))
+
+    def __title_search_url(self, title: str, limit: int) -> str:
+        search_query = f"{urllib.parse.urlencode({'query': title})}&{_TITLE_SEARCH_PARAMS}&limit={limit}"
+        return self.__api.search_by_title.format(QUERY=search_query)
+
+    def __paper_detail_url(self, paper_id: str) -> str:
+        return self.__api.search_by_id.format(PAPER_ID=paper_id, PARAMS=_PAPER_DETAIL_PARAMS)
+
+    def __sumeval_rouge_l(self, summary: str, references: str) -> float:
+        return self._rouge().rouge_l(summary, references)
+
+    def __fast_rouge_l(self, summary: str, references: str) -> float:
+        # same tokens and F1 (alpha=0.5) as RougeCalculator.rouge_l, only the LCS is delegated to rapidfuzz
+        tokenize = self._rouge().tokenize
+        summary_tokens = tokenize(summary)
+        reference_tokens = tokenize(references, True)
+        if len(summary_tokens) == 0 or len(reference_tokens) == 0:
+            return 0.0
+        # 1 - (m + n - 2 * LCS) / (m + n) == 2 * LCS / (m + n)
+        return Indel.normalized_similarity(summary_tokens, reference_tokens)
+
+    def __is_candidate_title(self, title_tokens: frozenset[str], ref_title: str) -> bool:
+        # cheap token-overlap gate before paying for the ROUGE-L LCS
+        ref_tokens = frozenset(ref_title.split())
+        overlap = len(title_tokens & ref_tokens)
+        return 0 < overlap and self.__prefilter_threshold <= overlap / min(len(title_tokens), len(ref_tokens))
+
+    def __is_match_normalized_title(self, title: str, ref_title: str) -> bool:
+        return (
+            self.__is_candidate_title(frozenset(title.split()), ref_title)
+            and self.__rouge_l(title, ref_title) > self.threshold
+        )
 
     def is_match_title(self, title: str, ref_title: str) -> bool:
         """
@@ -261,19 +729,9 @@ class SemanticScholar(object):
         Returns:
             bool: True if the title matches the reference title, False otherwise.
         """
-        # remove punctuation
-        title = title.lower()
-        ref_title = ref_title.lower()
-        for punc in string.punctuation:
-            title = title.replace(punc, " ")
-            ref_title = ref_title.replace(punc, " ")
-        title = re.sub(r"\s\s+", " ", title, count=1000)
-        ref_title = re.sub(r"\s\s+", " ", ref_title, count=1000)
-
-        score = self.__rouge.rouge_l(summary=title, references=ref_title)
-        return score > self.threshold
+        return self.__is_match_normalized_title(_normalize_title(title), _normalize_title(ref_title))
 
-    def get_paper_id_from_title(self, title: str, api_timeout: float = 5.0, sleep: float = 3.0) -> str:
+    def get_paper_id_from_title(self, title: str, api_timeout: float = 5.0, sleep: float = 0.0) -> str:
         """
         Retrieves the paper ID from the given title using the Semantic Scholar API.
 
@@ -284,53 +742,95 @@ class SemanticScholar(object):
         Returns:
             str: The paper ID if found, or an empty string if not found.
         """
-        # remove punctuation
-        title = title
-        title = re.sub(r"\s\s+", " ", title, count=1000)
-
-        retry = 0
-        while retry < self.__max_retry_count:
+        lookup = self.__title_lookup(title)
+        content = None
+        while True:
             try:
-                params = {
-                    "query": title,
-                    "fields": "title",
-                    "offset": 0,
-                    "limit": 100,
-                }
-                response = self.__api.urlopen(
-                    self.__api.search_by_title, timeout=api_timeout, QUERY=urllib.parse.urlencode(params)
-                )
-                content = json.loads(response.read().decode("utf-8"))
-                time.sleep(sleep)
-                break
-
+                url = lookup.send(content)
+            except StopIteration as stop:
+                return stop.value
+            try:
+                content = self._get_json(url, api_timeout, sleep, self.__title_search_ttl)
             except HTTPError as ex:
-                retry = self.__retry_and_wait(f"WARNING: {str(ex)} -> Retry: {retry}", ex, retry, sleep)
-            except URLError as ex:
-                retry = self.__retry_and_wait(f"WARNING: {str(ex)} -> Retry: {retry}", ex, retry, sleep)
-            except socket.timeout as ex:
-                retry = self.__retry_and_wait(f"WARNING: API Timeout -> Retry: {retry}", ex, retry, sleep)
-            except Exception as ex:
-                retry = self.__retry_and_wait(f"WARNING: {str(ex)} -> Retry: {retry}", ex, retry, sleep)
-
-            if self.__max_retry_count <= retry:
-                raise ExceedMaxRetryCountException(f"Exceeded Max Retry Count @ {title}")
-
-        if "data" not in content:
-            raise NoPaperFoundException(f"No Data Found @ {title}")
-
-        for item in content["data"]:
-            # remove punctuation
-            ref_str = item["title"].lower()
-            for punc in string.punctuation:
-                ref_str = ref_str.replace(punc, " ")
-            ref_str = re.sub(r"\s\s+", " ", ref_str, count=1000)
-
-            if self.is_match_title(title, ref_str):
+                if ex.code != 404:
+                    raise
+                content = None
+
+    def __title_lookup(self, title: str) -> Generator[str, Optional[dict], str]:
+        # the lookup shared by the sync and async clients: yields each URL to fetch, is sent back its JSON content
+        # (None for a 404) and returns the paper ID, so that only the transport differs between the two
+        title = " ".join(title.split())
+        query = _normalize_title(title)
+        cached = self.__cache_get(self.__title_cache_key(query))
+        if cached is not None:
+            return cached.decode("utf-8")
+
+        # the server-side best match is one small response; the relevance search is only a fallback
+        content = yield self.__title_match_url(title)
+        paper_id = self.__find_paper_id(query, (content or {}).get("data") or [])
+
+        if paper_id == "":
+            for limit in _TITLE_SEARCH_LIMITS:
+                content = yield self.__title_search_url(title, limit)
+
+                if content is None or "data" not in content:
+                    raise NoPaperFoundException(f"No Data Found @ {title}")
+
+                paper_id = self.__find_paper_id(query, content["data"])
+                if paper_id != "" or len(content["data"]) < limit:
+                    break
+        self.__cache_set_paper_id(query, paper_id)
+        return paper_id
+
+    def __find_paper_id(self, query: str, items: list[dict]) -> str:
+        # the query side is split and tokenized once, not once per candidate
+        query_set = frozenset(query.split())
+        candidates = []
+        for item in items:
+            ref_title = _normalize_title(item["title"])
+            if ref_title == query and 0 < len(query_set):
+                # identical after normalization, so no need to score any candidate
                 return item["paperId"].strip()
-        return ""
+            if self.__is_candidate_title(query_set, ref_title):
+                candidates.append((item, ref_title))
+
+        tokenize = self._rouge().tokenize
+        query_tokens = tokenize(query)
+        if len(query_tokens) == 0:
+            return ""
+        # ROUGE-L F1 = 2 * LCS / (m + n) <= 2 * min(m, n) / (m + n), so a candidate whose token count is too far
+        # from the query cannot clear the threshold whatever its content
+        scored = [
+            (item, ref_title, ref_tokens)
+            for item, ref_title in candidates
+            for ref_tokens in (tokenize(ref_title, True),)
+            if self.__within_length_bound(len(query_tokens), len(ref_tokens))
+        ]
+
+        if not self.__fast_match:
+            # the best candidate rather than the first one over the threshold, as extractOne picks below
+            best = max(scored, key=lambda candidate: self.__rouge_l(query, candidate[1]), default=None)
+            if best is None or self.__rouge_l(query, best[1]) <= self.threshold:
+                return ""
+            return best[0]["paperId"].strip()
+
+        # score every surviving candidate in a single native scan and keep the best one
+        if len(scored) == 0:
+            return ""
+        best = process.extractOne(
+            query_tokens,
+            [ref_tokens for _, _, ref_tokens in scored],
+            scorer=Indel.normalized_similarity,
+            score_cutoff=self.threshold,
+        )
+        if best is None or best[1] <= self.threshold:
+            return ""
+        return scored[best[2]][0]["paperId"].strip()
 
-    def get_paper_detail(self, paper_id: str, api_timeout: float = 5.0, sleep: float = 3.0) -> Paper:
+    def __within_length_bound(self, query_length: int, ref_length: int) -> bool:
+        return self.threshold * (query_length + ref_length) < 2 * min(query_length, ref_length)
+
+    def get_paper_detail(self, paper_id: str, api_timeout: float = 5.0, sleep: float = 0.0) -> Paper:
         """
         Retrieves detailed information about a paper from the Semantic Scholar API.
 
@@ -360,233 +860,346 @@ class SemanticScholar(object):
             NoPaperFoundException: If the maximum retry count is exceeded and no paper is found.
 
         """
+        content = self._get_json(self.__paper_detail_url(paper_id), api_timeout, sleep)
+        return _detailed_paper_from(content)
+
+    def iter_paper_references(self, paper_id: str, api_timeout: float = 5.0, sleep: float = 0.0) -> Iterator[Paper]:
+        """
+        Iterates over the papers referenced by the given paper, one page of the references endpoint at a time.
+
+        Pages are requested lazily, so a caller that stops early does not fetch or convert the remaining ones.
+
+        Args:
+            paper_id (str): The ID of the paper whose references to retrieve.
+            api_timeout (float, optional): The timeout value for each API request in seconds. Defaults to 5.0.
+            sleep (float, optional): An extra wait after each request, on top of the rate limiter. Defaults to 0.0.
+
+        Yields:
+            Paper: The referenced papers, in the order returned by the API.
+
+        Raises:
+            ExceedMaxRetryCountException: If the maximum retry count is exceeded.
+        """
+        offset = 0
+        while True:
+            params = f"{_REFERENCES_PARAMS}&offset={offset}&limit={_REFERENCES_PAGE_SIZE}"
+            content = self._get_json(
+                self.__api.search_references.format(PAPER_ID=paper_id, PARAMS=params), api_timeout, sleep
+            )
+            items = content.get("data") or []
+            for item in items:
+                if item.get("citedPaper"):
+                    yield _paper_from(item["citedPaper"])
+            if len(items) < _REFERENCES_PAGE_SIZE:
+                return
+            offset += len(items)
+
+    def get_paper_references(self, paper_id: str, api_timeout: float = 5.0, sleep: float = 0.0) -> list[Paper]:
+        """
+        Retrieves the papers referenced by the given paper.
+
+        Args:
+            paper_id (str): The ID of the paper whose references to retrieve.
+            api_timeout (float, optional): The timeout value for each API request in seconds. Defaults to 5.0.
+            sleep (float, optional): An extra wait after each request, on top of the rate limiter. Defaults to 0.0.
+
+        Returns:
+            list[Paper]: The referenced papers, in the order returned by the API.
+
+        Raises:
+            ExceedMaxRetryCountException: If the maximum retry count is exceeded.
+        """
+        return list(self.iter_paper_references(paper_id, api_timeout, sleep))
+
+    def prefetch(self, paper_id: str, api_timeout: float = 5.0, sleep: float = 0.0) -> Future[Paper]:
+        """
+        Starts retrieving a paper in the background, so that its request overlaps with the caller's own work.
+
+        Submitting the next paper before processing the current one hides the network round trip behind the
+        processing and the rate limiter's idle time. The paper lands in the response cache, so a later
+        `get_paper_detail` for the same ID is served locally.
+
+        Args:
+            paper_id (str): The ID of the paper to retrieve information for.
+            api_timeout (float, optional): The timeout value for the API request in seconds. Defaults to 5.0.
+            sleep (float, optional): An extra wait after the request, on top of the rate limiter. Defaults to 0.0.
+
+        Returns:
+            Future[Paper]: A future resolving to the detailed information about the paper.
+        """
+        if self.__prefetch_pool is None:
+            self.__prefetch_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pyss-prefetch")
+        return self.__prefetch_pool.submit(self.get_paper_detail, paper_id, api_timeout, sleep)
+
+    def get_paper_details(
+        self, paper_ids: list[str], api_timeout: float = 5.0, sleep: float = 0.0, max_workers: int = 8
+    ) -> list[Paper]:
+        """
+        Retrieves detailed information about multiple papers using a pool of worker threads.
+
+        Args:
+            paper_ids (list[str]): The IDs of the papers to retrieve information for.
+            api_timeout (float, optional): The timeout value for each API request in seconds. Defaults to 5.0.
+            sleep (float, optional): An extra wait after each request, on top of the rate limiter. Defaults to 0.0.
+            max_workers (int, optional): The number of worker threads. Defaults to 8.
+
+        Returns:
+            list[Paper]: The papers in the same order as `paper_ids`.
+
+        Raises:
+            ExceedMaxRetryCountException: If the maximum retry count is exceeded for any of the papers.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda paper_id: self.get_paper_detail(paper_id, api_timeout, sleep), paper_ids))
+
+    def _new_session(self) -> aiohttp.ClientSession:
+        # the one place the asynchronous client is built, e.g. for a subclass to tune the connector
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=16, limit_per_host=8, ttl_dns_cache=300),
+            headers=self.__api.headers,
+        )
+
+    def __get_session(self) -> aiohttp.ClientSession:
+        # the session is bound to the event loop it was created in, so a new loop gets a new session
+        loop = asyncio.get_running_loop()
+        if self.__session is None or self.__session.closed or self.__session_loop is not loop:
+            self.__session = self._new_session()
+            self.__session_loop = loop
+        return self.__session
+
+    async def aclose(self):
+        """
+        Closes the keep-alive connections of the asynchronous client.
+        """
+        if self.__session is not None and not self.__session.closed:
+            await self.__session.close()
+        self.__session = None
+        self.__session_loop = None
+
+    async def _fetch_json_async(
+        self,
+        url: str,
+        api_timeout: float = 5.0,
+        sleep: float = 0.0,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        ttl: Optional[float] = None,
+    ) -> Any:
+        """
+        Fetches a JSON document from the Semantic Scholar API without blocking the event loop.
+
+        Args:
+            url (str): The URL to fetch.
+            api_timeout (float, optional): The timeout value for the API request in seconds. Defaults to 5.0.
+            sleep (float, optional): An extra wait after each request, on top of the rate limiter. Defaults to 0.0.
+            semaphore (asyncio.Semaphore, optional): The semaphore capping the number of in-flight requests.
+            ttl (float, optional): The lifetime of the cached response in seconds. Defaults to the client's cache_ttl.
+
+        Returns:
+            Any: The decoded JSON content.
+
+        Raises:
+            ExceedMaxRetryCountException: If the maximum retry count is exceeded.
+        """
+        body = self.__cache_get(url)
+        if body is not None:
+            return orjson.loads(body)
+
+        stale_body, etag = self.__cache_get_validator(url)
+        headers = {"If-None-Match": etag} if etag else None
+        session = self.__get_session()
+        # counts attempts like urllib3.Retry(total=max_retry_count): one request plus that many retries
         retry = 0
-        while retry < self.__max_retry_count:
-            try:
-                fields = [
-                    "paperId",
-                    "url",
-                    "title",
-                    "abstract",
-                    "venue",
-                    "year",
-                    "referenceCount",
-                    "citationCount",
-                    "influentialCitationCount",
-                    "isOpenAccess",
-                    "openAccessPdf",
-                    "fieldsOfStudy",
-                    "externalIds",
-                    "publicationVenue",
-                    "publicationTypes",
-                    "publicationDate",
-                    "authors.authorId",
-                    "authors.name",
-                    "authors.url",
-                    "authors.affiliations",
-                    "authors.hIndex",
-                    "authors.paperCount",
-                    "authors.citationCount",
-                    "citations.paperId",
-                    "citations.title",
-                    "citations.year",
-                    "citations.url",
-                    "citations.abstract",
-                    "citations.authors",
-                    "citations.venue",
-                    "citations.journal",
-                    "citations.externalIds",
-                    "citations.fieldsOfStudy",
-                    "citations.publicationDate",
-                    "citations.publicationVenue",
-                    "citations.publicationTypes",
-                    "citations.referenceCount",
-                    "citations.citationCount",
-                    "citations.influentialCitationCount",
-                    "references.paperId",
-                    "references.title",
-                    "references.year",
-                    "references.url",
-                    "references.abstract",
-                    "references.authors",
-                    "references.venue",
-                    "references.journal",
-                    "references.externalIds",
-                    "references.fieldsOfStudy",
-                    "references.publicationDate",
-                    "references.publicationVenue",
-                    "references.publicationTypes",
-                    "references.referenceCount",
-                    "references.citationCount",
-                    "references.influentialCitationCount",
-                ]
-                params = f'fields={",".join(fields)}'
-                response = self.__api.urlopen(
-                    self.__api.search_by_id, timeout=api_timeout, PAPER_ID=paper_id, PARAMS=params
-                )
-                time.sleep(sleep)
+        while True:
+            async with semaphore or contextlib.nullcontext():
+                await self.__limiter.aacquire()
+                try:
+                    async with session.get(
+                        url, headers=headers, timeout=aiohttp.ClientTimeout(total=api_timeout)
+                    ) as response:
+                        if response.status == 304 and stale_body is not None:
+                            self.__cache_set(url, stale_body, etag, ttl)
+                            return orjson.loads(stale_body)
+                        if response.status not in _RETRY_STATUSES:
+                            response.raise_for_status()
+                            body = await response.read()
+                            content = orjson.loads(body)
+                            self.__cache_set(url, body, response.headers.get("ETag", ""), ttl)
+                            await asyncio.sleep(sleep)
+                            return content
+                        # throttled or a transient server error, retried like the synchronous client does
+                        retry += 1
+                        retry_after = response.headers.get("Retry-After", "")
+                        wait_time = (
+                            float(retry_after) if retry_after.isdigit() else _full_jitter(self.__wait_time, retry)
+                        )
+                        cause = "API Limit Exceeded" if response.status == 429 else f"HTTP {response.status}"
+                except aiohttp.ClientResponseError:
+                    raise
+                except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+                    retry += 1
+                    wait_time = _full_jitter(max(sleep, 1.0), retry)
+                    cause = str(ex)
+
+            if self.__max_retry_count < retry:
                 break
+            # backs off outside the semaphore, so that a waiting request does not hold up the others
+            if not self.__silent and self.__logger is not None:
+                self.__logger.warning(f"WARNING: {cause} -> Retry: {retry}")
+            await asyncio.sleep(wait_time)
 
-            except HTTPError as ex:
-                retry = self.__retry_and_wait(f"WARNING: {str(ex)} -> Retry: {retry}", ex, retry, sleep)
-            except URLError as ex:
-                retry = self.__retry_and_wait(f"WARNING: {str(ex)} -> Retry: {retry}", ex, retry, sleep)
-            except socket.timeout as ex:
-                retry = self.__retry_and_wait(f"WARNING: API Timeout -> Retry: {retry}", ex, retry, sleep)
-            except Exception as ex:
-                retry = self.__retry_and_wait(f"WARNING: {str(ex)} -> Retry: {retry}", ex, retry, sleep)
-
-            if self.__max_retry_count <= retry:
-                raise ExceedMaxRetryCountException(f"Exceeded Max Retry Count @ {paper_id}")
-
-        content = json.loads(response.read().decode("utf-8"))
-
-        paper = Paper(
-            paper_id=self.__clean(content, "paperId", ""),
-            title=self.__clean(content, "title", ""),
-            abstract=self.__clean(content, "abstract", ""),
-            authors=[
-                Author(
-                    author_id=self.__clean(item, "authorId", ""),
-                    author_name=self.__clean(item, "name", ""),
-                    url=self.__clean(item, "url", ""),
-                    affiliations=self.__clean(item, "affiliations", []),
-                    paper_count=self.__clean(item, "paperCount", 0),
-                    citation_count=self.__clean(item, "citationCount", 0),
-                    hindex=self.__clean(item, "hIndex", 0),
-                )
-                for item in self.__clean(content, "authors", [])
-            ],
-            venue=self.__clean(content, "venue", ""),
-            url=self.__clean(content, "url", ""),
-            publication_date=self.__clean(content, "publicationDate", datetime(1900, 1, 1)),
-            publication_venue=self.__clean(content, "publicationVenue", {}),
-            publication_types=self.__clean(content, "publicationTypes", []),
-            reference_count=self.__clean(content, "referenceCount", 0),
-            citation_count=self.__clean(content, "citationCount", 0),
-            influential_citation_count=self.__clean(content, "influentialCitationCount", 0),
-            is_open_access=self.__clean(content, "isOpenAccess", False),
-            open_access_pdf=self.__clean(content, "openAccessPdf", {}).get("url", ""),
-            fields_of_study=self.__clean(content, "fieldsOfStudy", []),
-            citations=[
-                Paper(
-                    paper_id=self.__clean(item, "paperId", ""),
-                    title=self.__clean(item, "title", ""),
-                    abstract=self.__clean(item, "abstract", ""),
-                    authors=[
-                        Author(
-                            author_id=self.__clean(author_item, "authorId", ""),
-                            author_name=self.__clean(author_item, "name", ""),
-                            url=self.__clean(author_item, "url", ""),
-                            affiliations=self.__clean(author_item, "affiliations", []),
-                            paper_count=self.__clean(author_item, "paperCount", 0),
-                            citation_count=self.__clean(author_item, "citationCount", 0),
-                            hindex=self.__clean(author_item, "hIndex", 0),
-                        )
-                        for author_item in self.__clean(item, "authors", [])
-                    ],
-                    venue=self.__clean(item, "venue", ""),
-                    url=self.__clean(item, "url", ""),
-                    publication_date=self.__clean(item, "publicationDate", datetime(1900, 1, 1)),
-                    publication_venue=self.__clean(content, "publicationVenue", {}),
-                    publication_types=self.__clean(content, "publicationTypes", []),
-                    reference_count=self.__clean(item, "referenceCount", 0),
-                    citation_count=self.__clean(item, "citationCount", 0),
-                    influential_citation_count=self.__clean(item, "influentialCitationCount", 0),
-                    is_open_access=self.__clean(item, "isOpenAccess", False),
-                    open_access_pdf=self.__clean(content, "openAccessPdf", {}).get("url", ""),
-                    fields_of_study=self.__clean(item, "fieldsOfStudy", []),
-                    external_ids=self.__clean(item, "externalIds", []),
-                    citations=[],
-                    references=[],
-                )
-                for item in self.__clean(content, "citations", [])
-            ],
-            references=[
-                Paper(
-                    paper_id=self.__clean(item, "paperId", ""),
-                    title=self.__clean(item, "title", ""),
-                    abstract=self.__clean(item, "abstract", ""),
-                    authors=[
-                        Author(
-                            author_id=self.__clean(author_item, "authorId", ""),
-                            author_name=self.__clean(author_item, "name", ""),
-                            url=self.__clean(author_item, "url", ""),
-                            affiliations=self.__clean(author_item, "affiliations", []),
-                            paper_count=self.__clean(author_item, "paperCount", 0),
-                            citation_count=self.__clean(author_item, "citationCount", 0),
-                            hindex=self.__clean(author_item, "hIndex", 0),
-                        )
-                        for author_item in self.__clean(item, "authors", [])
-                    ],
-                    venue=self.__clean(item, "venue", ""),
-                    url=self.__clean(item, "url", ""),
-                    publication_date=self.__clean(item, "publicationDate", datetime(1900, 1, 1)),
-                    publication_venue=self.__clean(content, "publicationVenue", {}),
-                    publication_types=self.__clean(content, "publicationTypes", []),
-                    reference_count=self.__clean(item, "referenceCount", 0),
-                    citation_count=self.__clean(item, "citationCount", 0),
-                    influential_citation_count=self.__clean(item, "influentialCitationCount", 0),
-                    is_open_access=self.__clean(item, "isOpenAccess", False),
-                    open_access_pdf=self.__clean(content, "openAccessPdf", {}).get("url", ""),
-                    fields_of_study=self.__clean(item, "fieldsOfStudy", []),
-                    external_ids=self.__clean(item, "externalIds", []),
-                    citations=[],
-                    references=[],
-                )
-                for item in self.__clean(content, "references", [])
+        raise ExceedMaxRetryCountException(f"Exceeded Max Retry Count @ {url}")
+
+    async def aget_paper_id_from_title(self, title: str, api_timeout: float = 5.0, sleep: float = 0.0) -> str:
+        """
+        Asynchronous variant of `get_paper_id_from_title`.
+
+        Args:
+            title (str): The title of the paper.
+            api_timeout (float, optional): The timeout value for each API request in seconds. Defaults to 5.0.
+            sleep (float, optional): An extra wait after each request, on top of the rate limiter. Defaults to 0.0.
+
+        Returns:
+            str: The paper ID if found, or an empty string if not found.
+        """
+        lookup = self.__title_lookup(title)
+        content = None
+        while True:
+            try:
+                url = lookup.send(content)
+            except StopIteration as stop:
+                return stop.value
+            try:
+                content = await self._fetch_json_async(url, api_timeout, sleep, ttl=self.__title_search_ttl)
+            except aiohttp.ClientResponseError as ex:
+                if ex.status != 404:
+                    raise
+                content = None
+
+    async def aget_paper_detail(self, paper_id: str, api_timeout: float = 5.0, sleep: float = 0.0) -> Paper:
+        """
+        Asynchronous variant of `get_paper_detail`.
+
+        Args:
+            paper_id (str): The ID of the paper to retrieve information for.
+            api_timeout (float, optional): The timeout value for the API request in seconds. Defaults to 5.0.
+            sleep (float, optional): An extra wait after the request, on top of the rate limiter. Defaults to 0.0.
+
+        Returns:
+            Paper: The detailed information about the paper.
+        """
+        return _detailed_paper_from(await self._fetch_json_async(self.__paper_detail_url(paper_id), api_timeout, sleep))
+
+    async def aget_author_detail(self, author_id: str, api_timeout: float = 5.0, sleep: float = 0.0) -> Author:
+        """
+        Asynchronous variant of `get_author_detail`.
+
+        Args:
+            author_id (str): The ID of the author to retrieve information for.
+            api_timeout (float, optional): The timeout value for the API request in seconds. Defaults to 5.0.
+            sleep (float, optional): An extra wait after the request, on top of the rate limiter. Defaults to 0.0.
+
+        Returns:
+            Author: The detailed information about the author.
+        """
+        content = await self._fetch_json_async(
+            self.__api.search_by_author_id.format(AUTHOR_ID=author_id, PARAMS=_AUTHOR_PARAMS), api_timeout, sleep
+        )
+        return _author_from(content)
+
+    async def aget_paper_details(
+        self, paper_ids: list[str], api_timeout: float = 5.0, sleep: float = 0.0, concurrency: int = 8
+    ) -> list[Union[Paper, BaseException]]:
+        """
+        Retrieves detailed information about multiple papers concurrently over a shared keep-alive session.
+
+        Args:
+            paper_ids (list[str]): The IDs of the papers to retrieve information for.
+            api_timeout (float, optional): The timeout value for each API request in seconds. Defaults to 5.0.
+            sleep (float, optional): An extra wait after each request, on top of the rate limiter. Defaults to 0.0.
+            concurrency (int, optional): The maximum number of in-flight requests. Defaults to 8.
+
+        Returns:
+            list[Union[Paper, BaseException]]: The papers in the same order as `paper_ids`.
+            A paper that could not be retrieved is replaced by the exception that was raised for it.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        contents = await asyncio.gather(
+            *[
+                self._fetch_json_async(self.__paper_detail_url(paper_id), api_timeout, sleep, semaphore)
+                for paper_id in paper_ids
             ],
-            external_ids=self.__clean(content, "externalIds", {}),
+            return_exceptions=True,
         )
+        return [
+            content if isinstance(content, BaseException) else _detailed_paper_from(content) for content in contents
+        ]
 
-        return paper
+    def get_paper_details_batch(
+        self, paper_ids: list[str], api_timeout: float = 5.0, sleep: float = 0.0, batch_size: int = _BATCH_SIZE
+    ) -> list[Paper]:
+        """
+        Retrieves detailed information about multiple papers with the bulk endpoint, one request per `batch_size` IDs.
 
-    def get_author_detail_by_name(
-        self, author_name: str, paper_id: str, api_timeout: float = 5.0, sleep: float = 3.0
-    ) -> Author:
-        retry = 0
-        while retry < self.__max_retry_count:
-            try:
-                fields = [
-                    "authorId",
-                    "url",
-                    "name",
-                    "affiliations",
-                    "paperCount",
-                    "citationCount",
-                    "hIndex",
-                ]
-                params = f'fields={",".join(fields)}'
-                query = "+".join([urllib.parse.quote(s) for s in author_name.lower().split()])
-                response = self.__api.urlopen(
-                    self.__api.search_by_author_name, timeout=api_timeout, QUERY=query, PARAMS=params
-                )
-                time.sleep(sleep)
-                break
+        Args:
+            paper_ids (list[str]): The IDs of the papers to retrieve information for. Duplicates are requested once.
+            api_timeout (float, optional): The timeout value for each API request in seconds. Defaults to 5.0.
+            sleep (float, optional): An extra wait after each request, on top of the rate limiter. Defaults to 0.0.
+            batch_size (int, optional): The number of IDs per request, at most 500. Defaults to 500.
 
-            except HTTPError as ex:
-                retry = self.__retry_and_wait(f"WARNING: {str(ex)} -> Retry: {retry}", ex, retry, sleep)
-            except URLError as ex:
-                retry = self.__retry_and_wait(f"WARNING: {str(ex)} -> Retry: {retry}", ex, retry, sleep)
-            except socket.timeout as ex:
-                retry = self.__retry_and_wait(f"WARNING: API Timeout -> Retry: {retry}", ex, retry, sleep)
-            except Exception as ex:
-                retry = self.__retry_and_wait(f"WARNING: {str(ex)} -> Retry: {retry}", ex, retry, sleep)
+        Returns:
+            list[Paper]: The papers in the same order as `paper_ids`.
 
-            if self.__max_retry_count <= retry:
-                raise Exception(f"Exceeded Max Retry Count @ {author_name}")
+        Raises:
+            NoPaperFoundException: If any of the papers is unknown to the API.
+            ExceedMaxRetryCountException: If the maximum retry count is exceeded.
+        """
+        unique_ids = list(dict.fromkeys(paper_ids))
+        papers: dict[str, Paper] = {}
+        # the batch shares its entries with get_paper_detail, so papers fetched either way are not fetched again
+        uncached_ids = []
+        for paper_id in unique_ids:
+            body = self.__cache_get(self.__paper_detail_url(paper_id))
+            if body is None:
+                uncached_ids.append(paper_id)
+            else:
+                papers[paper_id] = _detailed_paper_from(orjson.loads(body))
+
+        url = self.__api.search_by_ids.format(PARAMS=_PAPER_DETAIL_PARAMS)
+        for start in range(0, len(uncached_ids), batch_size):
+            chunk = uncached_ids[start : start + batch_size]
+            contents = self._post_json(url, {"ids": chunk}, api_timeout, sleep)
+            # the response is aligned with the request and holds null for unknown IDs
+            for paper_id, content in zip(chunk, contents):
+                if content:
+                    self.__cache_set(self.__paper_detail_url(paper_id), orjson.dumps(content))
+                    papers[paper_id] = _detailed_paper_from(content)
+
+        missing = [paper_id for paper_id in unique_ids if paper_id not in papers]
+        if missing:
+            raise NoPaperFoundException(f"No Paper Found @ {', '.join(missing)}")
+        return [papers[paper_id] for paper_id in paper_ids]
 
-        content = json.loads(response.read().decode("utf-8"))
+    def get_author_detail_by_name(
+        self, author_name: str, paper_id: str, api_timeout: float = 5.0, sleep: float = 0.0
+    ) -> Author:
+        query = urllib.parse.quote_plus(" ".join(author_name.lower().split()))
+        content = self._get_json(
+            self.__api.search_by_author_name.format(QUERY=query, PARAMS=_AUTHOR_SEARCH_PARAMS), api_timeout, sleep
+        )
 
         if "data" not in content:
             raise NoAuthorFoundException(f"No Data Found @ {author_name}")
 
         author = None
         if paper_id and len(content["data"]) > 0:
-            for data in content.get("data", []):
-                for paper in data.get("papers", []):
-                    if paper.get("paperId", "") == paper_id:
-                        author = data
+            author = next(
+                (
+                    data
+                    for data in content["data"]
+                    if any(paper.get("paperId", "") == paper_id for paper in data.get("papers") or ())
+                ),
+                None,
+            )
         elif len(content["data"]) > 0:
             author = content["data"][0]
         else:
@@ -595,58 +1208,13 @@ class SemanticScholar(object):
         if author is None:
             raise NoAuthorFoundException(f"No Author Found @ {author_name}")
 
-        author = Author(
-            author_id=self.__clean(author, "authorId", ""),
-            author_name=self.__clean(author, "name", ""),
-            url=self.__clean(author, "url", ""),
-            affiliations=self.__clean(author, "affiliations", []),
-            paper_count=self.__clean(author, "paperCount", 0),
-            citation_count=self.__clean(author, "citationCount", 0),
-            hindex=self.__clean(author, "hIndex", 0),
-        )
+        author = _author_from(author)
         return author
 
-    def get_author_detail(self, author_id: str, api_timeout: float = 5.0, sleep: float = 3.0) -> Author:
-        retry = 0
-        while retry < self.__max_retry_count:
-            try:
-                fields = [
-                    "authorId",
-                    "url",
-                    "name",
-                    "affiliations",
-                    "paperCount",
-                    "citationCount",
-                    "hIndex",
-                ]
-                params = f'fields={",".join(fields)}'
-                response = self.__api.urlopen(
-                    self.__api.search_by_author_id, timeout=api_timeout, AUTHOR_ID=author_id, PARAMS=params
-                )
-                time.sleep(sleep)
-                break
-
-            except HTTPError as ex:
-                retry = self.__retry_and_wait(f"WARNING: {str(ex)} -> Retry: {retry}", ex, retry, sleep)
-            except URLError as ex:
-                retry = self.__retry_and_wait(f"WARNING: {str(ex)} -> Retry: {retry}", ex, retry, sleep)
-            except socket.timeout as ex:
-                retry = self.__retry_and_wait(f"WARNING: API Timeout -> Retry: {retry}", ex, retry, sleep)
-            except Exception as ex:
-                retry = self.__retry_and_wait(f"WARNING: {str(ex)} -> Retry: {retry}", ex, retry, sleep)
-
-            if self.__max_retry_count <= retry:
-                raise Exception(f"Exceeded Max Retry Count @ {author_id}")
-
-        content = json.loads(response.read().decode("utf-8"))
-
-        author = Author(
-            author_id=self.__clean(content, "authorId", ""),
-            author_name=self.__clean(content, "name", ""),
-            url=self.__clean(content, "url", ""),
-            affiliations=self.__clean(content, "affiliations", []),
-            paper_count=self.__clean(content, "paperCount", 0),
-            citation_count=self.__clean(content, "citationCount", 0),
-            hindex=self.__clean(content, "hIndex", 0),
+    def get_author_detail(self, author_id: str, api_timeout: float = 5.0, sleep: float = 0.0) -> Author:
+        content = self._get_json(
+            self.__api.search_by_author_id.format(AUTHOR_ID=author_id, PARAMS=_AUTHOR_PARAMS), api_timeout, sleep
         )
+
+        author = _author_from(content)
         return author
@@ -23,17 +23,19 @@ setuptools.setup(
     ],
     long_description=long_description,
     install_requires=[
-        "attrdict @ git+https://github.com/akitenkrad/attrdict",
+        "aiohttp",
         "nltk",
         "numpy",
+        "orjson",
         "pandas",
         "plotly",
         "progressbar",
         "py-cpuinfo",
         "python-dateutil",
+        "rapidfuzz",
         "spacy",
         "janome",
         "sumeval",
-        "tqdm",
+        "urllib3[brotli]",
     ],
 )
@@ -0,0 +1,96 @@
+import contextlib
+import os
+from pathlib import Path
+
+import dotenv
+import pytest
+from vcr import VCR
+
+from pyss.semanticscholar import RateLimiter, SemanticScholar
+from tests.support import FileRateLimiter
+
+ATTENTION_PAPER_ID = "204e3073870fae3d05bcbc2f6a8e263d9b72e776"
+
+_ENV_PATH = Path(__file__).resolve().parent.parent / ".env"
+
+# read once per run rather than once per keyed fixture or test; an exported key takes precedence over .env
+API_KEY = os.environ.get("SEMANTIC_SCHOLAR_API_KEY") or dotenv.get_key(_ENV_PATH, "SEMANTIC_SCHOLAR_API_KEY")
+
+
+# record on the first run, replay afterwards; CI can pass --record-mode=none to forbid live calls
+# the body is matched too, so that a batch POST for other IDs is not answered with a recorded one
+_VCR_CONFIG = {
+    "filter_headers": ["x-api-key"],
+    "match_on": ["method", "scheme", "host", "port", "path", "query", "body"],
+    "record_mode": "once",
+}
+
+
+@pytest.fixture(scope="module")
+def vcr_config():
+    return dict(_VCR_CONFIG)
+
+
+@pytest.fixture(scope="session")
+def session_cassette(request):
+    # the cassettes of pytest-recording are per test and installed after the session fixtures have run, so those
+    # fixtures record their requests into cassettes of their own
+    if request.config.getoption("--disable-recording"):
+        return lambda name: contextlib.nullcontext()
+
+    recorder = VCR(
+        cassette_library_dir=str(Path(__file__).parent / "cassettes" / "session"),
+        record_mode=request.config.getoption("--record-mode") or _VCR_CONFIG["record_mode"],
+        filter_headers=_VCR_CONFIG["filter_headers"],
+        match_on=_VCR_CONFIG["match_on"],
+    )
+    return lambda name: recorder.use_cassette(f"{name}.yaml")
+
+
+@pytest.fixture(scope="session")
+def rate_limiter(tmp_path_factory):
+    if os.environ.get("PYTEST_XDIST_WORKER") is None:
+        return RateLimiter(1.0)
+
+    # the parent of the per-worker base temp directory is common to all workers of the run
+    return FileRateLimiter(1.0, tmp_path_factory.getbasetemp().parent / "rate_limiter")
+
+
+@pytest.fixture(scope="session")
+def ss(rate_limiter):
+    # without the on-disk cache every request goes to the cassette, so a test cannot pass on an earlier test's response
+    with SemanticScholar(
+        max_retry_count=3, silent=True, threshold=0.95, rate_limiter=rate_limiter, bypass_cache=True
+    ) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def ss_keyed(rate_limiter):
+    if not API_KEY:
+        pytest.skip("API key not found.")
+
+    with SemanticScholar(
+        api_key=API_KEY, max_retry_count=3, silent=True, threshold=0.95, rate_limiter=rate_limiter, bypass_cache=True
+    ) as client:
+        yield client
+
+
+@pytest.fixture(
+    params=["ss", pytest.param("ss_keyed", marks=pytest.mark.skipif(not API_KEY, reason="API key not found."))]
+)
+def client(request):
+    # runs a test once anonymously and once with the API key, the latter skipped at collection without one
+    return request.getfixturevalue(request.param)
+
+
+@pytest.fixture(scope="session")
+def attention_paper(ss, session_cassette):
+    with session_cassette("attention_paper"):
+        return ss.get_paper_details_batch([ATTENTION_PAPER_ID])[0]
+
+
+@pytest.fixture(scope="session")
+def attention_refs(ss, session_cassette):
+    with session_cassette("attention_refs"):
+        return ss.get_paper_references(ATTENTION_PAPER_ID)
@@ -0,0 +1,22 @@
+import time
+from pathlib import Path
+
+from filelock import FileLock
+
+from pyss.semanticscholar import RateLimiter
+
+
+class FileRateLimiter(RateLimiter):
+    # keeps the next free slot in a file so that the pytest-xdist workers share one request budget
+    def __init__(self, rate: float, path: Path):
+        super().__init__(rate)
+        self.__path = path
+        self.__lock = FileLock(f"{path}.lock")
+
+    def _reserve(self) -> float:
+        with self.__lock:
+            # wall-clock time, since monotonic clocks are not comparable across processes
+            now = time.time()
+            slot = max(now, float(self.__path.read_text())) if self.__path.exists() else now
+            self.__path.write_text(str(slot + self.interval))
+        return slot - now
@@ -1,16 +1,40 @@
+import asyncio
 from datetime import datetime
-from pathlib import Path
 
-import dotenv
 import pytest
 
 from pyss.semanticscholar import SemanticScholar
 
+_ATTENTION_PUBDATE = datetime(2017, 6, 12)
 
-def test_semanticscholar():
-    assert SemanticScholar() is not None
+
+def _assert_attention_paper(paper):
+    assert paper.title.lower() == "attention is all you need"
+    assert paper.abstract != ""
+    assert paper.authors[0].author_id != ""
+    assert paper.authors[0].author_name != ""
+    assert paper.citation_count > 0
+    assert paper.reference_count > 0
+    assert paper.influential_citation_count > 0
+    assert paper.publication_date == _ATTENTION_PUBDATE
+    assert paper.url != ""
+    assert paper.year == 2017
+    assert len(paper.references) > 0
+    assert len(paper.citations) > 0
+
+
+def _assert_requested(vcr, method, path):
+    # the clients bypass the response cache, so the cassette holds what the test itself sent
+    if vcr is not None:
+        assert any(request.method == method and request.path.endswith(path) for request in vcr.requests)
 
 
+def test_semanticscholar(ss):
+    assert isinstance(ss, SemanticScholar)
+
+
+@pytest.mark.integration
+@pytest.mark.vcr
 @pytest.mark.parametrize(
     "title",
     [
@@ -19,116 +43,108 @@ def test_semanticscholar():
         "SQuAD: 100,000+ Questions for Machine Comprehension of Text",
     ],
 )
-def test_get_paper_id_from_title(title):
-    ss = SemanticScholar(max_retry_count=15, silent=True, threshold=0.95)
-
-    paper_id = ""
-    try:
-        paper_id = ss.get_paper_id_from_title(title)
-    except Exception as e:
-        print(e)
+def test_get_paper_id_from_title(client, title, vcr):
+    paper_id = client.get_paper_id_from_title(title)
     assert paper_id != ""
+    _assert_requested(vcr, "GET", "/paper/search/match")
 
 
-def test_get_paper_detail():
+@pytest.mark.integration
+@pytest.mark.vcr
+def test_get_paper_detail(client, attention_paper, vcr):
     # 1. Arrange
-    ss = SemanticScholar(max_retry_count=15, silent=True, threshold=0.95)
     paper_id = "204e3073870fae3d05bcbc2f6a8e263d9b72e776"
 
     # 2. Act
-    paper = ss.get_paper_detail(paper_id)
+    paper = client.get_paper_detail(paper_id)
 
     # 3. Assert
     assert paper.paper_id == paper_id
-    assert paper.title.lower() == "attention is all you need"
-    assert paper.abstract != ""
-    assert paper.authors[0].author_id != ""
-    assert paper.authors[0].author_name != ""
-    assert paper.citation_count > 0
-    assert paper.reference_count > 0
-    assert paper.influential_citation_count > 0
-    assert paper.publication_date == datetime(2017, 6, 12, 0, 0)
-    assert paper.url != ""
-    assert paper.year == 2017
-    assert len(paper.references) > 0
-    assert len(paper.citations) > 0
+    _assert_attention_paper(paper)
+    assert paper.exact_match(attention_paper)
+    _assert_requested(vcr, "GET", f"/paper/{paper_id}")
 
 
-def test_get_author_detail():
+@pytest.mark.integration
+@pytest.mark.vcr
+def test_aget_paper_detail(ss, vcr):
     # 1. Arrange
-    ss = SemanticScholar(max_retry_count=15, silent=True, threshold=0.95)
-    author_id = "40348417"
+    paper_id = "204e3073870fae3d05bcbc2f6a8e263d9b72e776"
+
+    async def act():
+        try:
+            return await ss.aget_paper_detail(paper_id)
+        finally:
+            await ss.aclose()
 
     # 2. Act
-    author = ss.get_author_detail(author_id)
+    paper = asyncio.run(act())
 
     # 3. Assert
-    assert author.author_id == author_id
-    assert author.author_name != ""
+    assert paper.paper_id == paper_id
+    _assert_attention_paper(paper)
+    _assert_requested(vcr, "GET", f"/paper/{paper_id}")
 
 
-def test_get_paper_id_from_title_with_api_key():
+@pytest.mark.integration
+@pytest.mark.vcr
+def test_get_paper_details_batch(ss, vcr):
+    # 1. Arrange
+    paper_ids = ["204e3073870fae3d05bcbc2f6a8e263d9b72e776", "df2b0e26d0599ce3e70df8a9da02e51594e0e992"]
 
-    api_key = dotenv.get_key(Path(__file__).parent.parent / ".env", "SEMANTIC_SCHOLAR_API_KEY")
+    # 2. Act
+    papers = ss.get_paper_details_batch(paper_ids)
 
-    if not api_key:
-        print("API key not found. Skipping the test.")
-        return
+    # 3. Assert
+    assert [paper.paper_id for paper in papers] == paper_ids
+    assert papers[0].title.lower() == "attention is all you need"
+    assert papers[1].title != ""
+    _assert_requested(vcr, "POST", "/paper/batch")
 
-    ss = SemanticScholar(api_key=api_key, max_retry_count=15, silent=True, threshold=0.95)
 
-    paper_id = ""
-    try:
-        paper_id = ss.get_paper_id_from_title("Attention Is All You Need")
-    except Exception as e:
-        print(e)
-    assert paper_id != ""
+@pytest.mark.integration
+@pytest.mark.vcr
+def test_get_paper_details(ss, vcr):
+    # 1. Arrange
+    paper_ids = ["204e3073870fae3d05bcbc2f6a8e263d9b72e776", "df2b0e26d0599ce3e70df8a9da02e51594e0e992"]
 
+    # 2. Act
+    papers = ss.get_paper_details(paper_ids, max_workers=2)
 
-def test_get_paper_detail_with_api_key():
-    # 1. Arrange
-    api_key = dotenv.get_key(Path(__file__).parent.parent / ".env", "SEMANTIC_SCHOLAR_API_KEY")
+    # 3. Assert
+    assert [paper.paper_id for paper in papers] == paper_ids
+    assert papers[0].title.lower() == "attention is all you need"
+    assert papers[1].title != ""
+    for paper_id in paper_ids:
+        _assert_requested(vcr, "GET", f"/paper/{paper_id}")
 
-    if not api_key:
-        print("API key not found. Skipping the test.")
-        return
 
-    ss = SemanticScholar(api_key=api_key, max_retry_count=15, silent=True, threshold=0.95)
+@pytest.mark.integration
+@pytest.mark.vcr
+def test_get_paper_references(ss, attention_refs, vcr):
+    # 1. Arrange
     paper_id = "204e3073870fae3d05bcbc2f6a8e263d9b72e776"
 
     # 2. Act
-    paper = ss.get_paper_detail(paper_id)
+    reference_ids = [reference.paper_id for reference in ss.iter_paper_references(paper_id)]
 
     # 3. Assert
-    assert paper.paper_id == paper_id
-    assert paper.title.lower() == "attention is all you need"
-    assert paper.abstract != ""
-    assert paper.authors[0].author_id != ""
-    assert paper.authors[0].author_name != ""
-    assert paper.citation_count > 0
-    assert paper.reference_count > 0
-    assert paper.influential_citation_count > 0
-    assert paper.publication_date == datetime(2017, 6, 12, 0, 0)
-    assert paper.url != ""
-    assert paper.year == 2017
-    assert len(paper.references) > 0
-    assert len(paper.citations) > 0
+    assert len(attention_refs) > 0
+    assert all(reference.paper_id != "" for reference in attention_refs)
+    assert reference_ids == [reference.paper_id for reference in attention_refs]
+    _assert_requested(vcr, "GET", f"/paper/{paper_id}/references")
 
 
-def test_get_author_detail_with_api_key():
+@pytest.mark.integration
+@pytest.mark.vcr
+def test_get_author_detail(client, vcr):
     # 1. Arrange
-    api_key = dotenv.get_key(Path(__file__).parent.parent / ".env", "SEMANTIC_SCHOLAR_API_KEY")
-
-    if not api_key:
-        print("API key not found. Skipping the test.")
-        return
-
-    ss = SemanticScholar(api_key=api_key, max_retry_count=15, silent=True, threshold=0.95)
     author_id = "40348417"
 
     # 2. Act
-    author = ss.get_author_detail(author_id)
+    author = client.get_author_detail(author_id)
 
     # 3. Assert
     assert author.author_id == author_id
     assert author.author_name != ""
+    _assert_requested(vcr, "GET", f"/author/{author_id}")
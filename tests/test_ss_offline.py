@@ -0,0 +1,556 @@
+import asyncio
+import contextlib
+import hashlib
+import sqlite3
+import time
+import urllib.parse
+import zlib
+
+import orjson
+import pytest
+
+from pyss import semanticscholar
+from pyss.semanticscholar import (
+    _PAPER_DETAIL_PARAMS,
+    _PAPER_FIELDS,
+    Api,
+    NoPaperFoundException,
+    RateLimiter,
+    SemanticScholar,
+    _extract,
+    _FullJitterRetry,
+    _normalize_title,
+    _paper_from,
+)
+from tests.support import FileRateLimiter
+
+PAPER = {"paperId": "p1", "title": "Attention Is All You Need", "publicationDate": "2017-06-12"}
+
+
+class _Response(object):
+    def __init__(self, status: int = 200, data: bytes = b"", headers: dict = None):
+        self.status = status
+        self.data = data
+        self.headers = headers or {}
+        self.reason = ""
+
+
+class _HTTP(object):
+    # stands in for the shared PoolManager; `handler` maps (method, url, payload) to a response
+    def __init__(self, handler):
+        self.handler = handler
+        self.calls = []
+
+    def request(self, method, url, body=None, headers=None, retries=None, timeout=None):
+        self.calls.append((method, url, headers))
+        return self.handler(method, url, orjson.loads(body) if body else None)
+
+
+@pytest.fixture
+def http(monkeypatch, tmp_path):
+    def paper(method, url, payload):
+        paper_id = urllib.parse.urlsplit(url).path.rsplit("/", 1)[1]
+        return _Response(data=orjson.dumps(dict(PAPER, paperId=paper_id)))
+
+    fake = _HTTP(paper)
+    monkeypatch.setattr(semanticscholar, "_HTTP", fake)
+    monkeypatch.setattr(SemanticScholar, "CACHE_PATH", tmp_path / "responses.sqlite")
+    return fake
+
+
+class _AsyncResponse(object):
+    def __init__(self, status: int = 200, data: bytes = b"", headers: dict = None):
+        self.status = status
+        self.data = data
+        self.headers = headers or {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        assert self.status < 400
+
+    async def read(self) -> bytes:
+        return self.data
+
+
+class _Session(object):
+    # stands in for the aiohttp session, answering each GET with the next of `responses`
+    def __init__(self, *responses: _AsyncResponse):
+        self.responses = list(responses)
+        self.calls = []
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+    def get(self, url, headers=None, timeout=None):
+        self.calls.append((url, headers))
+        return self.responses.pop(0)
+
+
+def _client(**kwargs) -> SemanticScholar:
+    return SemanticScholar(silent=True, rate_limiter=RateLimiter(1000.0), **kwargs)
+
+
+def test_extract_replaces_mistyped_values_with_defaults():
+    # 1. Arrange
+    item = {"paperId": "p1", "title": "T", "citationCount": "5", "fieldsOfStudy": "CS", "isOpenAccess": None}
+
+    # 2. Act
+    fields = _extract(item, _PAPER_FIELDS)
+
+    # 3. Assert
+    assert fields["paper_id"] == "p1"
+    assert fields["citation_count"] == 0
+    assert fields["fields_of_study"] == []
+    assert fields["is_open_access"] is False
+
+
+def test_cache_is_separate_per_api_key(http):
+    # 1. Arrange
+    with _client() as anonymous, _client(api_key="secret") as keyed:
+        anonymous.get_paper_detail("p1")
+
+        # 2. Act
+        paper = keyed.get_paper_detail("p1")
+        keyed.get_paper_detail("p1")
+
+    # 3. Assert
+    assert paper.paper_id == "p1"
+    assert [headers.get("X-API-Key") for _, _, headers in http.calls] == [None, "secret"]
+    assert all(b"secret" not in path.read_bytes() for path in SemanticScholar.CACHE_PATH.parent.iterdir())
+
+
+def test_rate_limiter_spaces_reservations_by_the_interval():
+    # 1. Arrange
+    limiter = RateLimiter(10.0)
+
+    # 2. Act
+    delays = [limiter._reserve() for _ in range(3)]
+
+    # 3. Assert
+    assert delays[0] == 0.0
+    assert delays[1] == pytest.approx(0.1, abs=0.01)
+    assert delays[2] == pytest.approx(0.2, abs=0.01)
+
+
+def test_retry_takes_a_rate_limiter_slot_per_attempt():
+    # 1. Arrange
+    class CountingLimiter(RateLimiter):
+        def __init__(self):
+            super().__init__(1000.0)
+            self.count = 0
+
+        def _reserve(self) -> float:
+            self.count += 1
+            return 0.0
+
+    limiter = CountingLimiter()
+    retry = _FullJitterRetry(total=3, backoff_factor=0.0, limiter=limiter)
+
+    # 2. Act
+    retry = retry.increment("GET", "/paper", error=ConnectionError())
+    retry.sleep()
+    retry = retry.increment("GET", "/paper", error=ConnectionError())
+    retry.sleep()
+
+    # 3. Assert
+    assert retry.limiter is limiter
+    assert limiter.count == 2
+
+
+def test_async_fetch_retries_server_errors_outside_the_semaphore(http, monkeypatch):
+    # 1. Arrange
+    session = _Session(_AsyncResponse(503), _AsyncResponse(502), _AsyncResponse(data=orjson.dumps(PAPER)))
+    semaphore = asyncio.Semaphore(1)
+    backoffs = []
+    sleep = asyncio.sleep
+
+    async def record_sleep(delay):
+        if delay == 0.5:
+            backoffs.append(semaphore.locked())
+        await sleep(0)
+
+    monkeypatch.setattr(semanticscholar, "_full_jitter", lambda base, retry: 0.5)
+    monkeypatch.setattr(asyncio, "sleep", record_sleep)
+    with _client() as client:
+        monkeypatch.setattr(client, "_new_session", lambda: session)
+
+        # 2. Act
+        content = asyncio.run(client._fetch_json_async("https://api.semanticscholar.org/p1", semaphore=semaphore))
+
+    # 3. Assert
+    assert content == PAPER
+    assert len(session.calls) == 3
+    assert backoffs == [False, False]
+
+
+def test_async_fetch_counts_attempts_like_the_sync_retry(http, monkeypatch):
+    # 1. Arrange
+    session = _Session(*[_AsyncResponse(503) for _ in range(4)])
+    backoffs = []
+    sleep = asyncio.sleep
+
+    async def record_sleep(delay):
+        if delay == 0.5:
+            backoffs.append(delay)
+        await sleep(0)
+
+    monkeypatch.setattr(semanticscholar, "_full_jitter", lambda base, retry: 0.5)
+    monkeypatch.setattr(asyncio, "sleep", record_sleep)
+    with _client(max_retry_count=3) as client:
+        monkeypatch.setattr(client, "_new_session", lambda: session)
+
+        # 2. Act
+        with pytest.raises(semanticscholar.ExceedMaxRetryCountException):
+            asyncio.run(client._fetch_json_async("https://api.semanticscholar.org/p1"))
+
+    # 3. Assert
+    # one request plus three retries, as urllib3.Retry(total=3) would make, and no backoff after the last one
+    assert len(session.calls) == 4
+    assert len(backoffs) == 3
+
+
+@pytest.mark.parametrize("fast_match", [True, False])
+def test_title_match_picks_the_best_candidate(http, fast_match):
+    # 1. Arrange
+    titles = ["Deep Residual Learning for Image Recognition Tasks", "Deep Residual Learning in Image Recognition"]
+    data = [{"paperId": f"p{i}", "title": title} for i, title in enumerate(titles)]
+    http.handler = lambda method, url, payload: _Response(data=orjson.dumps({"data": data}))
+
+    # 2. Act
+    with _client(threshold=0.9, fast_match=fast_match) as client:
+        paper_id = client.get_paper_id_from_title("Deep Residual Learning for Image Recognition")
+
+    # 3. Assert
+    assert paper_id == "p1"
+
+
+def test_async_title_lookup_follows_the_sync_one(http, monkeypatch):
+    # 1. Arrange
+    title = "Deep Residual Learning for Image Recognition"
+    pages = [{"data": [{"paperId": "p0", "title": "Residual Networks"}]}, {"data": [{"paperId": "p1", "title": title}]}]
+    responses = iter(pages)
+    http.handler = lambda method, url, payload: _Response(data=orjson.dumps(next(responses)))
+    with _client() as client:
+        paper_id = client.get_paper_id_from_title(title)
+    session = _Session(*[_AsyncResponse(data=orjson.dumps(page)) for page in pages])
+
+    # 2. Act
+    with _client(bypass_cache=True) as client:
+        monkeypatch.setattr(client, "_new_session", lambda: session)
+        async_paper_id = asyncio.run(client.aget_paper_id_from_title(title))
+
+    # 3. Assert
+    assert async_paper_id == paper_id == "p1"
+    assert [url for url, _ in session.calls] == [url for _, url, _ in http.calls]
+
+
+def test_title_lookup_keeps_hits_and_retries_misses_after_an_hour(http, monkeypatch):
+    # 1. Arrange
+    def search(method, url, payload):
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(url).query)["query"][0]
+        data = [{"paperId": "p1", "title": query}] if query == "Attention Is All You Need" else []
+        return _Response(data=orjson.dumps({"data": data}))
+
+    http.handler = search
+    now = time.time()
+
+    with _client() as client:
+        hit = client.get_paper_id_from_title("Attention Is All You Need")
+        miss = client.get_paper_id_from_title("An Unindexed Paper")
+        requests = len(http.calls)
+
+        # 2. Act
+        cached = [
+            client.get_paper_id_from_title("Attention Is All You Need"),
+            client.get_paper_id_from_title("An Unindexed Paper"),
+        ]
+        cached_requests = len(http.calls) - requests
+        monkeypatch.setattr(time, "time", lambda: now + 2 * 60 * 60)
+        client.get_paper_id_from_title("Attention Is All You Need")
+        client.get_paper_id_from_title("An Unindexed Paper")
+
+    # 3. Assert
+    assert (hit, miss) == ("p1", "")
+    assert cached == ["p1", ""]
+    assert cached_requests == 0
+    # only the miss is looked up again, with the match endpoint and the first search page
+    assert len(http.calls) - requests == 2
+
+
+def test_exact_match_compares_member_counts():
+    # 1. Arrange
+    reference = _paper_from({"paperId": "r1", "title": "R"})
+    paper = _paper_from(PAPER, references=[reference])
+    longer = _paper_from(PAPER, references=[reference, _paper_from({"paperId": "r2", "title": "S"})])
+
+    # 2. Act
+    matches = (
+        paper.exact_match(longer),
+        longer.exact_match(paper),
+        paper.exact_match(_paper_from(PAPER, references=[reference])),
+    )
+
+    # 3. Assert
+    # zip alone would pair up only the first reference and call the papers identical
+    assert matches == (False, False, True)
+
+
+def test_references_are_read_page_by_page(http, monkeypatch):
+    # 1. Arrange
+    def references(method, url, payload):
+        offset = int(urllib.parse.parse_qs(urllib.parse.urlsplit(url).query)["offset"][0])
+        data = [{"citedPaper": {"paperId": f"r{i}", "title": "R"}} for i in range(offset, min(offset + 2, 3))]
+        return _Response(data=orjson.dumps({"offset": offset, "data": data}))
+
+    http.handler = references
+    monkeypatch.setattr(semanticscholar, "_REFERENCES_PAGE_SIZE", 2)
+
+    # 2. Act
+    with _client() as client:
+        papers = client.get_paper_references("p1")
+
+    # 3. Assert
+    assert [paper.paper_id for paper in papers] == ["r0", "r1", "r2"]
+    assert len(http.calls) == 2
+
+
+def _batch(method, url, payload):
+    # aligned with the requested IDs, with null for the unknown one
+    return _Response(data=orjson.dumps([None if i == "missing" else dict(PAPER, paperId=i) for i in payload["ids"]]))
+
+
+def test_batch_requests_each_id_once_and_keeps_the_input_order(http):
+    # 1. Arrange
+    payloads = []
+
+    def batch(method, url, payload):
+        payloads.append(payload)
+        return _batch(method, url, payload)
+
+    http.handler = batch
+
+    # 2. Act
+    with _client() as client:
+        papers = client.get_paper_details_batch(["b", "a", "b", "c"], batch_size=2)
+
+    # 3. Assert
+    assert [paper.paper_id for paper in papers] == ["b", "a", "b", "c"]
+    assert payloads == [{"ids": ["b", "a"]}, {"ids": ["c"]}]
+
+
+def test_batch_raises_for_unknown_ids(http):
+    # 1. Arrange
+    http.handler = _batch
+
+    # 2. Act
+    with _client() as client, pytest.raises(NoPaperFoundException) as ex:
+        client.get_paper_details_batch(["a", "missing"])
+
+    # 3. Assert
+    assert "missing" in str(ex.value)
+
+
+def test_batch_and_detail_lookups_share_the_cache(http):
+    # 1. Arrange
+    paper = http.handler
+
+    def route(method, url, payload):
+        return _batch(method, url, payload) if method == "POST" else paper(method, url, payload)
+
+    http.handler = route
+
+    with _client() as client:
+        client.get_paper_detail("p1")
+        client.get_paper_details_batch(["b1"])
+        requests = len(http.calls)
+
+        # 2. Act
+        batched = client.get_paper_details_batch(["p1"])
+        detailed = client.get_paper_detail("b1")
+
+    # 3. Assert
+    assert (batched[0].paper_id, detailed.paper_id) == ("p1", "b1")
+    assert len(http.calls) == requests
+
+
+def test_expired_entry_is_revalidated_with_its_etag(http, monkeypatch):
+    # 1. Arrange
+    def paper(method, url, payload):
+        return _Response(data=orjson.dumps(PAPER), headers={"ETag": '"v1"'})
+
+    def not_modified(method, url, payload):
+        return _Response(304, headers={"ETag": '"v1"'})
+
+    http.handler = paper
+    now = time.time()
+
+    with _client(cache_ttl=60) as client:
+        client.get_paper_detail("p1")
+        monkeypatch.setattr(time, "time", lambda: now + 120)
+        http.handler = not_modified
+
+        # 2. Act
+        revalidated = client.get_paper_detail("p1")
+        cached = client.get_paper_detail("p1")
+
+    # 3. Assert
+    assert (revalidated.paper_id, cached.paper_id) == ("p1", "p1")
+    assert [headers.get("If-None-Match") for _, _, headers in http.calls] == [None, '"v1"']
+    with contextlib.closing(sqlite3.connect(SemanticScholar.CACHE_PATH)) as cache:
+        (expire,) = cache.execute("SELECT expire FROM responses").fetchone()
+    assert now + 120 < expire
+
+
+def test_expired_entry_is_revalidated_on_the_async_path(http, monkeypatch):
+    # 1. Arrange
+    http.handler = lambda method, url, payload: _Response(data=orjson.dumps(PAPER), headers={"ETag": '"v1"'})
+    session = _Session(_AsyncResponse(304))
+    now = time.time()
+
+    with _client(cache_ttl=60) as client:
+        client.get_paper_detail("p1")
+        monkeypatch.setattr(time, "time", lambda: now + 120)
+        monkeypatch.setattr(client, "_new_session", lambda: session)
+
+        # 2. Act
+        paper = asyncio.run(client.aget_paper_detail("p1"))
+
+    # 3. Assert
+    assert paper.paper_id == "p1"
+    assert [headers for _, headers in session.calls] == [{"If-None-Match": '"v1"'}]
+
+
+def test_cache_written_before_etags_is_migrated(http):
+    # 1. Arrange
+    url = Api().search_by_id.format(PAPER_ID="p1", PARAMS=_PAPER_DETAIL_PARAMS)
+    with contextlib.closing(sqlite3.connect(SemanticScholar.CACHE_PATH)) as cache, cache:
+        cache.execute("CREATE TABLE responses (key TEXT PRIMARY KEY, expire REAL, body BLOB)")
+        cache.execute(
+            "INSERT INTO responses VALUES (?, ?, ?)",
+            (hashlib.blake2b(url.encode("utf-8")).hexdigest(), time.time() + 60, zlib.compress(orjson.dumps(PAPER))),
+        )
+
+    # 2. Act
+    with _client() as client:
+        paper = client.get_paper_detail("p1")
+        client.get_paper_detail("p2")
+
+    # 3. Assert
+    assert paper.paper_id == "p1"
+    assert len(http.calls) == 1
+    with contextlib.closing(sqlite3.connect(SemanticScholar.CACHE_PATH)) as cache:
+        assert "etag" in {row[1] for row in cache.execute("PRAGMA table_info(responses)")}
+
+
+def test_prefetched_paper_is_served_from_the_cache(http):
+    # 1. Arrange
+    with _client() as client:
+        prefetched = client.prefetch("p1").result()
+
+        # 2. Act
+        paper = client.get_paper_detail("p1")
+
+    # 3. Assert
+    assert (prefetched.paper_id, paper.paper_id) == ("p1", "p1")
+    assert len(http.calls) == 1
+
+
+def test_close_waits_for_queued_prefetches(http):
+    # 1. Arrange
+    client = _client()
+    futures = [client.prefetch(f"p{i}") for i in range(4)]
+
+    # 2. Act
+    client.close()
+
+    # 3. Assert
+    assert not any(future.cancelled() for future in futures)
+    assert [future.result().paper_id for future in futures] == ["p0", "p1", "p2", "p3"]
+
+
+def test_file_rate_limiter_is_shared_through_its_file(tmp_path):
+    # 1. Arrange
+    first, second = FileRateLimiter(10.0, tmp_path / "rate_limiter"), FileRateLimiter(10.0, tmp_path / "rate_limiter")
+
+    # 2. Act
+    delays = [first._reserve(), second._reserve(), first._reserve()]
+
+    # 3. Assert
+    assert delays[0] == 0.0
+    assert delays[1] == pytest.approx(0.1, abs=0.01)
+    assert delays[2] == pytest.approx(0.2, abs=0.01)
+
+
+@pytest.mark.parametrize(
+    "title, normalized",
+    [
+        ("Attention Is All You Need", "attention is all you need"),
+        (
+            "  BERT: Pre-training of Deep\tBidirectional Transformers ",
+            "bert pre training of deep bidirectional transformers",
+        ),
+        ("SQuAD: 100,000+ Questions!", "squad 100 000 questions"),
+    ],
+)
+def test_normalize_title(title, normalized):
+    assert _normalize_title(title) == normalized
+
+
+@pytest.mark.parametrize("fast_match", [True, False])
+@pytest.mark.parametrize(
+    "ref_title, paper_id",
+    [
+        # 2 * 5 / (5 + 6) = 0.91 clears 0.9, 2 * 5 / (5 + 7) = 0.83 cannot, whatever the common tokens
+        ("Deep Residual Learning for Image Recognition Tasks", "p0"),
+        ("Deep Residual Learning for Image Recognition Tasks Today", ""),
+    ],
+)
+def test_title_lookup_bounds_candidates_by_length(http, fast_match, ref_title, paper_id):
+    # 1. Arrange
+    data = [{"paperId": "p0", "title": ref_title}]
+    http.handler = lambda method, url, payload: _Response(data=orjson.dumps({"data": data}))
+
+    # 2. Act
+    with _client(threshold=0.9, fast_match=fast_match) as client:
+        found = client.get_paper_id_from_title("Deep Residual Learning for Image Recognition")
+
+    # 3. Assert
+    assert found == paper_id
+
+
+@pytest.mark.parametrize(
+    "title, ref_title",
+    [
+        ("Attention Is All You Need", "Attention Is All You Need"),
+        ("Deep Residual Learning for Image Recognition", "Deep Residual Learning for Image Recognition Tasks"),
+        ("BERT: Pre-training of Deep Bidirectional Transformers", "Pre-training Deep Transformers for BERT"),
+        ("SQuAD: 100,000+ Questions for Machine Comprehension of Text", "Machine Comprehension of Text"),
+    ],
+)
+def test_fast_rouge_l_agrees_with_sumeval(title, ref_title):
+    # 1. Arrange
+    score = SemanticScholar._rouge().rouge_l(_normalize_title(title), _normalize_title(ref_title))
+
+    for threshold in (score - 1e-6, score + 1e-6):
+        # 2. Act
+        matches = [
+            _client(
+                threshold=threshold, prefilter_threshold=0.0, fast_match=fast_match, bypass_cache=True
+            ).is_match_title(title, ref_title)
+            for fast_match in (True, False)
+        ]
+
+        # 3. Assert
+        assert matches == [threshold < score] * 2
+
+
+def test_is_match_title_ignores_case_and_punctuation(http):
+    with _client() as client:
+        assert client.is_match_title("Attention is all you need.", "ATTENTION IS ALL YOU NEED")
+        assert not client.is_match_title("Attention Is All You Need", "Deep Residual Learning for Image Recognition")